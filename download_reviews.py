@@ -1,249 +1,607 @@
-import openreview
 import getpass
 import sys
 import argparse
 from urllib.parse import urlparse, parse_qs
 import os
+import re
+import json
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
-def parse_url(url):
+# openreview and requests are imported lazily inside the functions that use them
+# (is_transient_error, ensure_pooled_session, connect_client, process_forum), so that
+# --help and argument errors do not pay for loading them.
+
+API_BASE_URL = 'https://api2.openreview.net'
+
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+OUTPUT_DIR = "reviews"
+OUTPUT_BUFFER_SIZE = 1 << 20
+MD_SEPARATOR = b"\n\n---\n\n"
+TXT_SEPARATOR = b"\n\n" + b"=" * 80 + b"\n\n"
+
+VENUE_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'openreview-downloader',
+    'venues.json'
+)
+VENUE_CACHE_TTL = 7 * 24 * 60 * 60
+# Serializes the read-modify-write of the cache file between forum worker threads.
+VENUE_CACHE_LOCK = threading.Lock()
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_JITTER = 0.5
+
+def is_transient_error(error):
     """
-    Parses the OpenReview URL to extract forum_id and potentially venue_id.
+    Tells whether an API error is worth retrying (connection problems, 429 and 5xx).
+    Client errors such as 401/403/404 will not go away by asking again.
+    """
+    import openreview
+    import requests
+
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, openreview.OpenReviewException):
+        details = error.args[0] if error.args else None
+        status = details.get('status') if isinstance(details, dict) else None
+        return isinstance(status, int) and (status == 429 or status >= 500)
+    return False
+
+def call_with_retry(fn, *args, **kwargs):
+    """
+    Calls an OpenReview client function, retrying transient failures with
+    exponential backoff and jitter.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt == RETRY_ATTEMPTS - 1 or not is_transient_error(e):
+                raise
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt * (1 + random.random() * RETRY_JITTER))
+            print(f"Transient error ({e}). Retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+def ensure_pooled_session(client):
+    """
+    Makes sure every API call of the client goes through one keep-alive connection pool,
+    so only the first request pays for the TCP/TLS handshake.
+    """
+    from requests.adapters import HTTPAdapter
+
+    session = getattr(client, 'session', None)
+    if session is None:
+        return
+    adapter = session.get_adapter(API_BASE_URL)
+    # Recent openreview-py versions already mount a large pool; keep it (and its retry policy).
+    if getattr(adapter, '_pool_maxsize', 0) >= POOL_MAXSIZE:
+        return
+    session.mount('https://', HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=getattr(adapter, 'max_retries', 0)
+    ))
+
+def load_venue_cache():
+    """
+    Loads the forum_id -> venue_id cache, or an empty one if it is missing or unreadable.
     """
     try:
-        if '#' in url:
-            url = url.split('#', 1)[0]
-            
-        parsed_url = urlparse(url)
-        query_params = parse_qs(parsed_url.query)
-        
-        if 'id' not in query_params:
-            print(f"Error: Could not find 'id' in the URL query: {url}")
-            return None, None
-            
-        forum_id = query_params['id'][0]
-        venue_id = None
+        with open(VENUE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
 
-        if 'referrer' in query_params:
-            referrer = query_params['referrer'][0]
-            if 'id=' in referrer:
-                parts = referrer.split('id=')[-1].split('/')
-                if len(parts) >= 3:
-                    venue_id = f"{parts[0]}/{parts[1]}/{parts[2]}"
-                    print(f"Intelligently parsed venue_id: {venue_id}")
+def get_cached_venue_id(forum_id):
+    """
+    Returns the cached venue_id of a forum, unless it is missing or older than the TTL.
+    """
+    entry = load_venue_cache().get(forum_id)
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get('ts', 0) > VENUE_CACHE_TTL:
+        return None
+    return entry.get('venue')
 
-        return forum_id, venue_id
+def cache_venue_id(forum_id, venue_id):
+    """
+    Stores the venue_id of a forum. The file is replaced atomically so concurrent runs never see half a write.
+    """
+    with VENUE_CACHE_LOCK:
+        cache = load_venue_cache()
+        cache[forum_id] = {'venue': venue_id, 'ts': time.time()}
+        try:
+            cache_dir = os.path.dirname(VENUE_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+                os.replace(tmp_path, VENUE_CACHE_PATH)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not update venue cache for {forum_id}: {e}")
 
-    except Exception as e:
-        print(f"Error parsing URL: {e}")
-        return None, None
+# Venue id (first three path segments) of the group linked from the "referrer" parameter,
+# e.g. "[Author Console](/group?id=AAAI.org/2026/Conference/Authors#...)".
+REFERRER_VENUE_RE = re.compile(r'id=([^/&)#]+)/([^/&)#]+)/([^/&)#]+)')
 
-def fetch_reviews(client, forum_id, venue_id):
+def connect_client():
     """
-    Fetches the review notes.
+    Creates an unauthenticated client and opens its connection to the API.
+    The pool is set up first, so the warmed-up connection is the one login reuses.
     """
-    reviews = []
+    import openreview
+    import requests
+
+    client = openreview.api.OpenReviewClient(baseurl=API_BASE_URL)
+    ensure_pooled_session(client)
+    session = getattr(client, 'session', None)
+    if session is not None:
+        try:
+            session.head(API_BASE_URL, timeout=10)
+        except requests.RequestException:
+            pass
+    return client
+
+@lru_cache(maxsize=1024)
+def parse_url_parts(url):
+    """
+    Pure, memoized part of parse_url: returns (forum_id, venue_id, error_message).
+    """
+    url = url.split('#', 1)[0]
+
+    try:
+        query_params = parse_qs(urlparse(url).query)
+    except ValueError as e:
+        return None, None, f"Error parsing URL: {e}"
     
-    if venue_id:
-        common_invitations = [
-            f'{venue_id}/-/Official_Review',
-            f'{venue_id}/-/Review'
-        ]
-        
-        for i, invitation in enumerate(common_invitations):
-            attempt_num = i + 1
-            print(f"\nAttempt {attempt_num}: Searching for reviews with invitation: '{invitation}'...")
-            try:
-                reviews = client.get_all_notes(
-                    invitation=invitation,
-                    forum=forum_id
-                )
-                if reviews:
-                    print(f"Success: Found {len(reviews)} review(s) with this invitation.")
-                    return reviews
-                else:
-                    print(f"Attempt {attempt_num} found 0 reviews.")
-            except Exception as e:
-                print(f"Attempt {attempt_num} failed with error: {e}")
+    if 'id' not in query_params:
+        return None, None, f"Error: Could not find 'id' in the URL query: {url}"
         
-        print("\nAll default invitation searches failed.")
+    forum_id = query_params['id'][0]
+    venue_id = None
 
-    else:
-        print("\nVenue ID is unknown. Skipping default invitation search.")
+    if 'referrer' in query_params:
+        match = REFERRER_VENUE_RE.search(query_params['referrer'][0])
+        if match:
+            venue_id = '/'.join(match.groups())
 
-    print("Proceeding to (Fallback) broad search for all replies in this forum...")
-    
+    return forum_id, venue_id, None
+
+def parse_url(url):
+    """
+    Parses the OpenReview URL to extract forum_id and potentially venue_id.
+    """
+    forum_id, venue_id, error_message = parse_url_parts(url)
+    if error_message:
+        print(error_message)
+    elif venue_id:
+        print(f"Intelligently parsed venue_id: {venue_id}")
+    return forum_id, venue_id
+
+REVIEW_INVITATION_SUFFIXES = ('/Official_Review', '/Review')
+
+def note_invitations(note):
+    """
+    Returns the invitation ids of a note (v2 'invitations' list or v1 'invitation').
+    """
+    invitations = getattr(note, 'invitations', None)
+    if invitations:
+        return invitations
+    invitation = getattr(note, 'invitation', None)
+    return [invitation] if invitation else []
+
+def is_review_note(note, venue_prefix=''):
+    """
+    Checks whether a note was posted under a review invitation starting with venue_prefix.
+    """
+    return any(
+        invitation.startswith(venue_prefix) and invitation.endswith(REVIEW_INVITATION_SUFFIXES)
+        for invitation in note_invitations(note)
+    )
+
+REPLIES_PAGE_SIZE = 100
+# Oldest first: reviews come out in posting order, and offset paging stays stable across pages.
+REPLIES_SORT = 'cdate:asc'
+
+def iter_replies(client, forum_id, page_size=REPLIES_PAGE_SIZE):
+    """
+    Starts fetching the notes of a forum and returns an iterator over them.
+    The first page is requested immediately, so the caller can do other work meanwhile.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    fetch_page = partial(call_with_retry, client.get_notes, forum=forum_id, sort=REPLIES_SORT, limit=page_size)
+    first_page = executor.submit(fetch_page, offset=0)
+    return iter_pages(executor, fetch_page, first_page, page_size)
+
+def iter_pages(executor, fetch_page, next_page, page_size):
+    """
+    Yields the notes page by page, so they can be processed as they arrive.
+    The next page is already requested while the current one is being processed.
+    """
+    offset = 0
     try:
-        all_replies = client.get_all_notes(forum=forum_id)
-        reviews = [
-            r for r in all_replies 
-            if r.id != forum_id
-        ]
-        
-        if reviews:
-            print(f"\nBroad search found {len(reviews)} total replies. Sifting for reviews...")
-            return reviews
+        while True:
+            page = next_page.result()
+            if len(page) < page_size:
+                yield from page
+                return
+            offset += page_size
+            next_page = executor.submit(fetch_page, offset=offset)
+            yield from page
+    finally:
+        next_page.cancel()
+        executor.shutdown(wait=False)
+
+def fetch_reviews(client, forum_id, venue_id, forum_replies=None):
+    """
+    Yields the review notes as their pages arrive.
+    forum_replies may be an iterator already started with iter_replies.
+
+    Replies are partitioned locally by invitation. Non-review replies are held
+    back and only yielded if the forum turns out to contain no review at all.
+    """
+    print(f"\nSearching for all replies in forum {forum_id}...")
+    
+    if forum_replies is None:
+        forum_replies = iter_replies(client, forum_id)
+    venue_prefix = f"{venue_id}/" if venue_id else ''
+    review_count = 0
+    other_replies = []
+    # API errors (already retried if transient) propagate: a failed search must not
+    # be mistaken for a forum without replies.
+    for reply in forum_replies:
+        if reply.id == forum_id:
+            continue
+        if is_review_note(reply, venue_prefix):
+            review_count += 1
+            yield reply
         else:
-            print("\nBroad search found 0 replies to this forum.")
-            return []
+            other_replies.append(reply)
 
-    except Exception as e:
-        print(f"Broad search failed: {e}")
-        return []
+    if review_count:
+        print(f"Success: Found {review_count} review(s) among {review_count + len(other_replies)} replies in {forum_id}.")
+        return
 
-    return []
+    if not other_replies:
+        print(f"\nSearch found 0 replies to forum {forum_id}.")
+        return
+
+    print(f"\nNo reply in {forum_id} uses a review invitation. Falling back to all {len(other_replies)} replies for sifting...")
+    yield from other_replies
+
+# Content keys whose text is emitted without a "### <Key>" sub-header.
+HEADERLESS_KEYS = frozenset({'review', 'comment'})
+
+# Turns the "value" of a content field into text, keyed by the exact JSON type.
+VALUE_FORMATTERS = {
+    str: lambda value: value,
+    int: str,
+    float: str,
+    bool: str,
+    list: lambda value: ", ".join(map(str, value)),
+}
 
 def extract_text_from_value(content_item):
     """
     Extracts text from various OpenReview value formats.
     e.g., "string", {"value": "string"}, {"value": 8}, {"value": ["list"]}
     """
-    extracted_text = None
+    # The {"value": ...} shape dominates v2 API content, so it is checked first and
+    # formatted with a single table lookup instead of a chain of type tests.
+    item_type = type(content_item)
     
-    if isinstance(content_item, dict) and 'value' in content_item:
-        value = content_item['value']
-        if isinstance(value, str):
-            extracted_text = value
-        elif isinstance(value, (int, float)):
-            extracted_text = str(value)
-        elif isinstance(value, list):
-            extracted_text = ", ".join(str(v) for v in value)
-    
-    elif isinstance(content_item, str):
+    if item_type is dict:
+        value = content_item.get('value')
+        value_type = type(value)
+        # Fast path for the overwhelmingly common {"value": "<text>"} field.
+        if value_type is str:
+            return value if value.strip() else None
+        formatter = VALUE_FORMATTERS.get(value_type)
+        if formatter is None:
+            return None
+        extracted_text = formatter(value)
+    elif item_type is str:
         extracted_text = content_item
+    else:
+        return None
+    
+    return extracted_text if extracted_text.strip() else None
+
+def detect_venue_id(client, forum_id):
+    """
+    Derives the venue_id from the invitation of the submission note and caches it.
+    """
+    print(f"\nVenue ID not provided or parsed for {forum_id}. Trying to auto-detect...")
+    try:
+        submission_note = call_with_retry(client.get_note, id=forum_id)
+    except Exception as e:
+        print(f"Warning: Could not auto-detect Venue ID for {forum_id}: {e}")
+        return None
+
+    invitations = note_invitations(submission_note)
+    if not invitations:
+        print(f"Submission note {forum_id} has no invitation.")
+        return None
+
+    venue_id = invitations[0].split('/-/')[0]
+    print(f"Auto-detected Venue ID for {forum_id}: {venue_id}")
+    cache_venue_id(forum_id, venue_id)
+    return venue_id
+
+@lru_cache(maxsize=256)
+def section_prefix(key):
+    """
+    Returns the Markdown header that introduces a content field.
+    Keys repeat across all notes of a venue, so each one is normalized only once.
+    """
+    # Special handling for "Review" or "Comment" keys
+    # If the key is literally "Review", we usually don't need a "### Review" header
+    # as it's redundant with the "Review X" top header.
+    if key.lower() in HEADERLESS_KEYS:
+        return ""
+    # Clean up the key for the header (e.g. "soundness_justification" -> "Soundness Justification")
+    # Handle keys that might already have spaces
+    title = key.replace('_', ' ').title()
+    return f"### {title}\n\n"
+
+def extract_review_parts(note):
+    """
+    Turns the content of a note into Markdown sections, one per non-empty field.
+    """
+    raw_text_parts = []
+    
+    # --- DYNAMIC AUTOMATION LOGIC ---
+    # Instead of looking for specific keys, we iterate through EVERYTHING in the content.
+    # OpenReview API usually returns content in the order it was defined in the form.
+    
+    content = note.content
+    if content:
+        # Bind the per-field helpers to locals once instead of looking them up for every field.
+        append = raw_text_parts.append
+        extract = extract_text_from_value
+        prefix = section_prefix
         
-    if extracted_text and extracted_text.strip():
-        return extracted_text
-    return None
+        for key, content_item in content.items():
+            
+            # Extract the text regardless of the key name
+            extracted_text = extract(content_item)
+            
+            if extracted_text:
+                append(prefix(key) + extracted_text)
+    
+    return raw_text_parts
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Download OpenReview reviews as raw text and Markdown."
+def has_review_text(note):
+    """
+    Checks whether a note has at least one parseable text field, without formatting it.
+    """
+    return bool(note.content) and any(
+        extract_text_from_value(content_item) for content_item in note.content.values()
     )
-    parser.add_argument('--email', type=str, required=True, help="Your OpenReview login email.")
-    parser.add_argument('--url', type=str, help="The full OpenReview URL of your paper.")
-    parser.add_argument('--forum_id', type=str, help="Manual override for paper's forum ID.")
-    parser.add_argument('--venue_id', type=str, help="Manual override for the venue ID.")
 
-    args = parser.parse_args()
+def count_reviews(replies, max_count=None):
+    """
+    Counts the replies with parseable text, stopping early once max_count is reached.
+    """
+    found_review_count = 0
+    for note in replies:
+        if has_review_text(note):
+            found_review_count += 1
+            if max_count and found_review_count >= max_count:
+                break
+    return found_review_count
 
-    forum_id = args.forum_id
-    venue_id = args.venue_id
+def process_forum(client, forum_id, venue_id=None, count_only=False, max_count=None):
+    """
+    Downloads (or only counts) the reviews of one forum.
+    Returns the number of reviews found, or None if the forum could not be processed.
+    """
+    import openreview
+    import requests
 
-    if args.url:
-        print(f"Parsing URL: {args.url}")
-        parsed_forum_id, parsed_venue_id = parse_url(args.url)
-        if not forum_id:
-            forum_id = parsed_forum_id
-        if not venue_id and parsed_venue_id:
-            venue_id = parsed_venue_id
-    
-    if not forum_id:
-        print("\nError: Could not determine Paper Forum ID.")
-        sys.exit(1)
+    if not venue_id:
+        venue_id = get_cached_venue_id(forum_id)
+        if venue_id:
+            print(f"\nUsing cached Venue ID for {forum_id}: {venue_id}")
 
-    try:
-        email_to_use = args.email.strip().strip("“”'\"")
-        password = getpass.getpass(prompt=f"Enter OpenReview password for {email_to_use}: ")
-        client = openreview.api.OpenReviewClient(
-            baseurl='https://api2.openreview.net',
-            username=email_to_use,
-            password=password
-        )
-        print(f"\nSuccessfully logged in as {email_to_use} (using v2 API).")
-    except Exception as e:
-        print(f"\nLogin failed: {e}")
-        sys.exit(1)
+    # Start downloading the replies right away, so that the venue auto-detection
+    # below overlaps with the first page request instead of preceding it.
+    forum_replies = iter_replies(client, forum_id)
 
     if not venue_id:
-        print("\nVenue ID not provided or parsed. Trying to auto-detect...")
-        try:
-            submission_note = client.get_note(id=forum_id)
-            if hasattr(submission_note, 'invitation'):
-                venue_id = submission_note.invitation.split('/-/')[0]
-                print(f"Auto-detected Venue ID: {venue_id}")
-            else:
-                print("Submission note has no 'invitation' attribute.")
-        except Exception as e:
-            print(f"Warning: Could not auto-detect Venue ID: {e}")
+        venue_id = detect_venue_id(client, forum_id)
 
-    replies = fetch_reviews(client, forum_id, venue_id)
+    replies = fetch_reviews(client, forum_id, venue_id, forum_replies)
 
-    if not replies:
-        print("\nNo replies were found.")
-        sys.exit(0)
+    if count_only:
+        try:
+            found_review_count = count_reviews(replies, max_count)
+        except (openreview.OpenReviewException, requests.RequestException) as e:
+            print(f"\nSearch for replies of {forum_id} failed: {e}")
+            return None
+        print(f"\nFound {found_review_count} parseable review(s) for {forum_id}.")
+        return found_review_count
 
-    OUTPUT_DIR = "reviews"
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     
     output_filename_md = os.path.join(OUTPUT_DIR, f"reviews_{forum_id}.md")
     output_filename_txt = os.path.join(OUTPUT_DIR, f"reviews_{forum_id}.txt")
     
-    print(f"\n--- Sifting {len(replies)} replies... --- \n")
+    print(f"\n--- Sifting replies of {forum_id} as they arrive... --- \n")
     
     found_review_count = 0
+    # Reviews are streamed into temporary files that only replace the real outputs once
+    # every page has been fetched, so a failed run never clobbers a previous complete download.
+    temp_filename_md = output_filename_md + '.tmp'
+    temp_filename_txt = output_filename_txt + '.tmp'
     
     try:
-        with open(output_filename_md, 'w', encoding='utf-8') as f_md, \
-             open(output_filename_txt, 'w', encoding='utf-8') as f_txt:
+        with open(temp_filename_md, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f_md, \
+             open(temp_filename_txt, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f_txt:
             
-            for i, note in enumerate(replies):
-                
-                raw_text_parts = []
-                
-                # --- DYNAMIC AUTOMATION LOGIC ---
-                # Instead of looking for specific keys, we iterate through EVERYTHING in the content.
-                # OpenReview API usually returns content in the order it was defined in the form.
-                
-                if note.content:
-                    for key, content_item in note.content.items():
-                        
-                        # Extract the text regardless of the key name
-                        extracted_text = extract_text_from_value(content_item)
-                        
-                        if extracted_text:
-                            # Clean up the key for the header (e.g. "soundness_justification" -> "Soundness Justification")
-                            # Handle keys that might already have spaces
-                            title = key.replace('_', ' ').title()
-                            
-                            # Special handling for "Review" or "Comment" keys
-                            # If the key is literally "Review", we usually don't need a "### Review" header
-                            # as it's redundant with the "Review X" top header.
-                            if title.lower() in ['review', 'comment']:
-                                raw_text_parts.append(extracted_text)
-                            else:
-                                raw_text_parts.append(f"### {title}\n\n{extracted_text}")
+            for note in replies:
                 
+                raw_text_parts = extract_review_parts(note)
                 
                 if raw_text_parts:
                     found_review_count += 1
-                    print(f"Processing Review {found_review_count} (ID: {note.id})...")
+                    print(f"Processing Review {found_review_count} of {forum_id} (ID: {note.id})...")
                     
-                    final_raw_text = "\n\n".join(raw_text_parts)
+                    # Encode the body once and hand the pre-encoded pieces straight to each
+                    # file's buffer, without concatenating (and so copying) the body per file.
+                    final_raw_bytes = "\n\n".join(raw_text_parts).encode('utf-8')
 
-                    f_md.write(f"## Review {found_review_count} (ID: {note.id})\n\n")
-                    f_txt.write(f"--- Review {found_review_count} (ID: {note.id}) ---\n\n")
+                    f_md.writelines((
+                        f"## Review {found_review_count} (ID: {note.id})\n\n".encode('utf-8'),
+                        final_raw_bytes,
+                        MD_SEPARATOR
+                    ))
+                    f_txt.writelines((
+                        f"--- Review {found_review_count} (ID: {note.id}) ---\n\n".encode('utf-8'),
+                        final_raw_bytes,
+                        TXT_SEPARATOR
+                    ))
 
-                    f_md.write(final_raw_text)
-                    f_txt.write(final_raw_text)
-                    
-                    f_md.write("\n\n---\n\n")
-                    f_txt.write("\n\n" + "="*80 + "\n\n")
+                    if max_count and found_review_count >= max_count:
+                        print(f"Reached --max_count={max_count} for {forum_id}, stopping.")
+                        break
+
+        if found_review_count:
+            os.replace(temp_filename_md, output_filename_md)
+            os.replace(temp_filename_txt, output_filename_txt)
 
+    except (openreview.OpenReviewException, requests.RequestException) as e:
+        print(f"\nSearch for replies of {forum_id} failed: {e}")
+        return None
     except Exception as e:
-        print(f"Error writing to file: {e}")
-        sys.exit(1)
+        print(f"Error writing to file for {forum_id}: {e}")
+        return None
+    finally:
+        # Leftovers only exist if the outputs were not replaced (failure or no reviews).
+        for filename in (temp_filename_md, temp_filename_txt):
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
 
     if found_review_count == 0:
-        print(f"\nNo reviews with parseable text fields were found.")
-        try:
-            os.remove(output_filename_md)
-            os.remove(output_filename_txt)
-        except OSError:
-            pass
+        print(f"\nNo reviews with parseable text fields were found for {forum_id}.")
     else:
-        print(f"\n✅ Success! All {found_review_count} reviews have been saved.")
+        print(f"\n✅ Success! All {found_review_count} reviews of {forum_id} have been saved.")
         print(f"Markdown file: {output_filename_md}")
         print(f"Text file:     {output_filename_txt}")
+    return found_review_count
+
+def read_forum_ids(path):
+    """
+    Reads one forum ID per line, skipping blank lines, '#' comments and duplicates.
+    Duplicates would make two workers write the same output files at once.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = (line.split('#', 1)[0].strip() for line in f)
+        return list(dict.fromkeys(line for line in lines if line))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Download OpenReview reviews as raw text and Markdown."
+    )
+    parser.add_argument('--email', type=str, required=True, help="Your OpenReview login email.")
+    parser.add_argument('--url', type=str, help="The full OpenReview URL of your paper.")
+    parser.add_argument('--forum_id', type=str, help="Manual override for paper's forum ID.")
+    parser.add_argument('--venue_id', type=str, help="Manual override for the venue ID.")
+    parser.add_argument('--forum_ids_file', type=str, help="File with one forum ID per line, to download several papers at once.")
+    parser.add_argument('--concurrency', type=int, default=8, help="Number of forums processed in parallel with --forum_ids_file (default: 8).")
+    parser.add_argument('--count_only', action='store_true', help="Only report how many parseable reviews exist; write no files.")
+    parser.add_argument('--max_count', type=int, help="Stop after this many parseable reviews.")
+
+    args = parser.parse_args()
+
+    if args.max_count is not None and args.max_count < 1:
+        parser.error("--max_count must be a positive integer.")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be a positive integer.")
+    if args.forum_ids_file and (args.url or args.forum_id):
+        parser.error("--forum_ids_file cannot be combined with --url or --forum_id.")
+
+    venue_id = args.venue_id
+
+    if args.forum_ids_file:
+        try:
+            forum_ids = read_forum_ids(args.forum_ids_file)
+        except OSError as e:
+            print(f"\nError: Could not read forum IDs: {e}")
+            sys.exit(1)
+        if not forum_ids:
+            print(f"\nError: No forum IDs found in {args.forum_ids_file}.")
+            sys.exit(1)
+    else:
+        forum_id = args.forum_id
+
+        if args.url:
+            print(f"Parsing URL: {args.url}")
+            parsed_forum_id, parsed_venue_id = parse_url(args.url)
+            if not forum_id:
+                forum_id = parsed_forum_id
+            if not venue_id and parsed_venue_id:
+                venue_id = parsed_venue_id
+        
+        if not forum_id:
+            print("\nError: Could not determine Paper Forum ID.")
+            sys.exit(1)
+
+        forum_ids = [forum_id]
+
+    try:
+        email_to_use = args.email.strip().strip("“”'\"")
+        # Connect while the user is still typing the password.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            client_future = executor.submit(connect_client)
+            password = getpass.getpass(prompt=f"Enter OpenReview password for {email_to_use}: ")
+            client = client_future.result()
+        call_with_retry(client.login_user, username=email_to_use, password=password)
+        print(f"\nSuccessfully logged in as {email_to_use} (using v2 API).")
+    except Exception as e:
+        print(f"\nLogin failed: {e}")
+        sys.exit(1)
+
+    process = partial(
+        process_forum,
+        client,
+        venue_id=venue_id,
+        count_only=args.count_only,
+        max_count=args.max_count
+    )
+
+    if len(forum_ids) == 1:
+        results = [process(forum_ids[0])]
+    else:
+        # All forums share the one logged-in client, and with it its connection pool.
+        print(f"\nProcessing {len(forum_ids)} forums, {args.concurrency} at a time...")
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(process, forum_ids))
+
+        total = sum(count for count in results if count)
+        print(f"\nDone: {total} review(s) across {len(forum_ids)} forums.")
+
+    failed_forum_ids = [forum_id for forum_id, count in zip(forum_ids, results) if count is None]
+    if failed_forum_ids:
+        if len(forum_ids) > 1:
+            print(f"Failed forums: {', '.join(failed_forum_ids)}")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()